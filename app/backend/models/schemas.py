@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from typing import List, Optional, Dict, Any
 from src.llm.models import ModelProvider
 
@@ -31,21 +31,32 @@ class HedgeFundRequest(BaseModel):
     initial_cash: float = 100000.0
     margin_requirement: float = 0.0
 
+    # agent_id -> AgentModelConfig, built on first lookup
+    _agent_model_index: Optional[Dict[str, AgentModelConfig]] = PrivateAttr(default=None)
+
     def get_start_date(self) -> str:
         """Calculate start date if not provided"""
         if self.start_date:
             return self.start_date
-        return (datetime.strptime(self.end_date, "%Y-%m-%d") - timedelta(days=90)).strftime("%Y-%m-%d")
+        return (datetime.fromisoformat(self.end_date) - timedelta(days=90)).strftime("%Y-%m-%d")
 
     def get_agent_model_config(self, agent_id: str) -> tuple[str, ModelProvider]:
         """Get model configuration for a specific agent"""
         if self.agent_models:
-            for config in self.agent_models:
-                if config.agent_id == agent_id:
-                    return (
-                        config.model_name or self.model_name,
-                        config.model_provider or self.model_provider
-                    )
+            index = self._agent_model_index
+            if index is None:
+                # Index once so each agent's lookup is O(1); the first config for an agent wins.
+                # Build it locally and publish it complete, since analyst threads share this request.
+                index = {}
+                for config in self.agent_models:
+                    index.setdefault(config.agent_id, config)
+                self._agent_model_index = index
+            config = index.get(agent_id)
+            if config:
+                return (
+                    config.model_name or self.model_name,
+                    config.model_provider or self.model_provider
+                )
         # Fallback to global model settings
         return self.model_name, self.model_provider
 
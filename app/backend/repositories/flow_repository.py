@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from sqlalchemy.orm import Session
 from app.backend.database.models import HedgeFundFlow
 
@@ -38,6 +38,13 @@ class FlowRepository:
             query = query.filter(HedgeFundFlow.is_template == False)
         return query.order_by(HedgeFundFlow.updated_at.desc()).all()
     
+    def iter_flows(self, include_templates: bool = True, batch_size: int = 100) -> Iterator[HedgeFundFlow]:
+        """Iterate over flows in batches instead of loading them all at once"""
+        query = self.db.query(HedgeFundFlow)
+        if not include_templates:
+            query = query.filter(HedgeFundFlow.is_template == False)
+        return query.order_by(HedgeFundFlow.updated_at.desc()).yield_per(batch_size)
+    
     def get_flows_by_name(self, name: str) -> List[HedgeFundFlow]:
         """Search flows by name (case-insensitive partial match)"""
         return self.db.query(HedgeFundFlow).filter(
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List
 
-from app.backend.database import get_db
+from app.backend.database import get_db, SessionLocal
 from app.backend.repositories.flow_repository import FlowRepository
 from app.backend.models.schemas import (
     FlowCreateRequest, 
@@ -23,7 +24,7 @@ router = APIRouter(prefix="/flows", tags=["flows"])
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def create_flow(request: FlowCreateRequest, db: Session = Depends(get_db)):
+def create_flow(request: FlowCreateRequest, db: Session = Depends(get_db)):
     """Create a new hedge fund flow"""
     try:
         repo = FlowRepository(db)
@@ -49,7 +50,7 @@ async def create_flow(request: FlowCreateRequest, db: Session = Depends(get_db))
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def get_flows(include_templates: bool = True, db: Session = Depends(get_db)):
+def get_flows(include_templates: bool = True, db: Session = Depends(get_db)):
     """Get all flows (summary view)"""
     try:
         repo = FlowRepository(db)
@@ -59,6 +60,27 @@ async def get_flows(include_templates: bool = True, db: Session = Depends(get_db
         raise HTTPException(status_code=500, detail=f"Failed to retrieve flows: {str(e)}")
 
 
+@router.get(
+    "/stream",
+    responses={
+        200: {"description": "Newline-delimited JSON stream of flow summaries"},
+    },
+)
+def stream_flows(include_templates: bool = True):
+    """Stream all flows (summary view) as newline-delimited JSON, one flow per line"""
+    def flow_generator():
+        # The stream outlives the request dependencies, so it manages its own session
+        db = SessionLocal()
+        try:
+            repo = FlowRepository(db)
+            for flow in repo.iter_flows(include_templates=include_templates):
+                yield FlowSummaryResponse.from_orm(flow).model_dump_json() + "\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(flow_generator(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/{flow_id}",
     response_model=FlowResponse,
@@ -67,7 +89,7 @@ async def get_flows(include_templates: bool = True, db: Session = Depends(get_db
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def get_flow(flow_id: int, db: Session = Depends(get_db)):
+def get_flow(flow_id: int, db: Session = Depends(get_db)):
     """Get a specific flow by ID"""
     try:
         repo = FlowRepository(db)
@@ -89,7 +111,7 @@ async def get_flow(flow_id: int, db: Session = Depends(get_db)):
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def update_flow(flow_id: int, request: FlowUpdateRequest, db: Session = Depends(get_db)):
+def update_flow(flow_id: int, request: FlowUpdateRequest, db: Session = Depends(get_db)):
     """Update an existing flow"""
     try:
         repo = FlowRepository(db)
@@ -121,7 +143,7 @@ async def update_flow(flow_id: int, request: FlowUpdateRequest, db: Session = De
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def delete_flow(flow_id: int, db: Session = Depends(get_db)):
+def delete_flow(flow_id: int, db: Session = Depends(get_db)):
     """Delete a flow"""
     try:
         repo = FlowRepository(db)
@@ -143,7 +165,7 @@ async def delete_flow(flow_id: int, db: Session = Depends(get_db)):
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def duplicate_flow(flow_id: int, new_name: str = None, db: Session = Depends(get_db)):
+def duplicate_flow(flow_id: int, new_name: str = None, db: Session = Depends(get_db)):
     """Create a copy of an existing flow"""
     try:
         repo = FlowRepository(db)
@@ -164,7 +186,7 @@ async def duplicate_flow(flow_id: int, new_name: str = None, db: Session = Depen
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def search_flows(name: str, db: Session = Depends(get_db)):
+def search_flows(name: str, db: Session = Depends(get_db)):
     """Search flows by name"""
     try:
         repo = FlowRepository(db)
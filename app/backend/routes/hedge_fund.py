@@ -1,16 +1,29 @@
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 import asyncio
+import orjson
 
 from app.backend.models.schemas import ErrorResponse, HedgeFundRequest
 from app.backend.models.events import StartEvent, ProgressUpdateEvent, ErrorEvent, CompleteEvent
-from app.backend.services.graph import create_graph, parse_hedge_fund_response, run_graph_async
+from app.backend.services.graph import get_compiled_graph, parse_hedge_fund_response, run_graph_async
 from app.backend.services.portfolio import create_portfolio
 from src.utils.progress import progress
 from src.utils.analysts import get_agents_list
 from src.llm.models import get_models_list
 
-router = APIRouter(prefix="/hedge-fund")
+router = APIRouter(prefix="/hedge-fund", default_response_class=ORJSONResponse)
+
+# Serialized catalog bodies. Agents and models are fixed at import time, so each is encoded once.
+_catalog_cache: dict[str, bytes] = {}
+
+
+def _catalog_response(key: str, build_payload) -> Response:
+    """Return the cached JSON body for a catalog, encoding it on first use."""
+    body = _catalog_cache.get(key)
+    if body is None:
+        body = orjson.dumps(build_payload())
+        _catalog_cache[key] = body
+    return Response(content=body, media_type="application/json")
 
 @router.post(
     path="/run",
@@ -25,9 +38,8 @@ async def run_hedge_fund(request: HedgeFundRequest):
         # Create the portfolio
         portfolio = create_portfolio(request.initial_cash, request.margin_requirement, request.tickers)
 
-        # Construct agent graph
-        graph = create_graph(request.selected_agents)
-        graph = graph.compile()
+        # Get the compiled agent graph
+        graph = get_compiled_graph(request.selected_agents)
 
         # Log a test progress update for debugging
         progress.update_status("system", None, "Preparing hedge fund run")
@@ -117,7 +129,7 @@ async def run_hedge_fund(request: HedgeFundRequest):
 async def get_agents():
     """Get the list of available agents."""
     try:
-        return {"agents": get_agents_list()}
+        return _catalog_response("agents", lambda: {"agents": get_agents_list()})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve agents: {str(e)}")
 
@@ -132,7 +144,7 @@ async def get_agents():
 async def get_language_models():
     """Get the list of available models."""
     try:
-        return {"models": get_models_list()}
+        return _catalog_response("models", lambda: {"models": get_models_list()})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve models: {str(e)}")
 
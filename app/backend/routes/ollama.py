@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any
+import asyncio
 import logging
 
 from app.backend.models.schemas import ErrorResponse
@@ -305,7 +306,8 @@ async def cancel_download(model_name: str):
     try:
         logger.info(f"Cancel download request for model: {model_name}")
         
-        success = ollama_service.cancel_download(model_name)
+        # cancel_download waits for the process to exit, so keep it off the event loop
+        success = await asyncio.to_thread(ollama_service.cancel_download, model_name)
         
         if success:
             return ActionResponse(success=True, message=f"Download cancelled for {model_name}")
@@ -19,7 +19,7 @@ class SaveJsonRequest(BaseModel):
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def save_json_file(request: SaveJsonRequest):
+def save_json_file(request: SaveJsonRequest):
     """Save JSON data to the project's /outputs directory."""
     try:
         # Create outputs directory if it doesn't exist
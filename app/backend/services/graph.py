@@ -1,14 +1,19 @@
 import asyncio
+import functools
 import json
+import logging
+import orjson
 from langchain_core.messages import HumanMessage
 from langgraph.graph import END, StateGraph
 
 from src.agents.portfolio_manager import portfolio_management_agent
 from src.agents.risk_manager import risk_management_agent
 from src.main import start
-from src.utils.analysts import ANALYST_CONFIG
+from src.utils.analysts import ANALYST_NODES
 from src.graph.state import AgentState
 
+logger = logging.getLogger(__name__)
+
 
 # Helper function to create the agent graph
 def create_graph(selected_agents: list[str]) -> StateGraph:
@@ -17,14 +22,11 @@ def create_graph(selected_agents: list[str]) -> StateGraph:
     graph.add_node("start_node", start)
 
     # Filter out any agents that are not in analyst.py
-    selected_agents = [agent for agent in selected_agents if agent in ANALYST_CONFIG]
-
-    # Get analyst nodes from the configuration
-    analyst_nodes = {key: (f"{key}_agent", config["agent_func"]) for key, config in ANALYST_CONFIG.items()}
+    selected_agents = [agent for agent in selected_agents if agent in ANALYST_NODES]
 
     # Add selected analyst nodes
     for agent_name in selected_agents:
-        node_name, node_func = analyst_nodes[agent_name]
+        node_name, node_func = ANALYST_NODES[agent_name]
         graph.add_node(node_name, node_func)
         graph.add_edge("start_node", node_name)
 
@@ -34,7 +36,7 @@ def create_graph(selected_agents: list[str]) -> StateGraph:
 
     # Connect selected agents to risk management
     for agent_name in selected_agents:
-        node_name = analyst_nodes[agent_name][0]
+        node_name = ANALYST_NODES[agent_name][0]
         graph.add_edge(node_name, "risk_management_agent")
 
     # Connect the risk management agent to the portfolio management agent
@@ -48,6 +50,16 @@ def create_graph(selected_agents: list[str]) -> StateGraph:
     return graph
 
 
+@functools.lru_cache(maxsize=32)
+def _compile_graph(selected_agents: tuple[str, ...]):
+    return create_graph(list(selected_agents)).compile()
+
+
+def get_compiled_graph(selected_agents: list[str]):
+    """Get the compiled agent graph, reusing it across runs with the same agent selection."""
+    return _compile_graph(tuple(selected_agents))
+
+
 async def run_graph_async(graph, portfolio, tickers, start_date, end_date, model_name, model_provider, request=None):
     """Async wrapper for run_graph to work with asyncio."""
     # Use run_in_executor to run the synchronous function in a separate thread
@@ -99,13 +111,17 @@ def run_graph(
 def parse_hedge_fund_response(response):
     """Parses a JSON string and returns a dictionary."""
     try:
-        return json.loads(response)
+        try:
+            return orjson.loads(response)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity and non-str input; let the stdlib parser accept the former and raise TypeError for the latter
+            return json.loads(response)
     except json.JSONDecodeError as e:
-        print(f"JSON decoding error: {e}\nResponse: {repr(response)}")
+        logger.error("JSON decoding error: %s\nResponse: %r", e, response)
         return None
     except TypeError as e:
-        print(f"Invalid response type (expected string, got {type(response).__name__}): {e}")
+        logger.error("Invalid response type (expected string, got %s): %s", type(response).__name__, e)
         return None
     except Exception as e:
-        print(f"Unexpected error while parsing response: {e}\nResponse: {repr(response)}")
+        logger.error("Unexpected error while parsing response: %s\nResponse: %r", e, response)
         return None
@@ -466,8 +466,11 @@ class OllamaService:
         loop = asyncio.get_event_loop()
         
         try:
-            is_installed = await loop.run_in_executor(None, self._is_ollama_installed)
-            is_running = await loop.run_in_executor(None, self._is_ollama_server_running)
+            # The install and server checks are independent, so run them concurrently
+            is_installed, is_running = await asyncio.gather(
+                loop.run_in_executor(None, self._is_ollama_installed),
+                loop.run_in_executor(None, self._is_ollama_server_running),
+            )
             
             models = []
             if is_running:
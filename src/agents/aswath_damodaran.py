@@ -13,7 +13,7 @@ from src.tools.api import (
     get_market_cap,
     search_line_items,
 )
-from src.utils.llm import call_llm
+from src.utils.llm import call_llm, to_prompt_json
 from src.utils.progress import progress
 
 
@@ -398,7 +398,7 @@ def generate_damodaran_output(
         ]
     )
 
-    prompt = template.invoke({"analysis_data": json.dumps(analysis_data, indent=2), "ticker": ticker})
+    prompt = template.invoke({"analysis_data": to_prompt_json(analysis_data), "ticker": ticker})
 
     def default_signal():
         return AswathDamodaranSignal(
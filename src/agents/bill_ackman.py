@@ -7,7 +7,7 @@ from pydantic import BaseModel
 import json
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.llm import call_llm, to_prompt_json
 
 
 class BillAckmanSignal(BaseModel):
@@ -445,7 +445,7 @@ def generate_ackman_output(
     ])
 
     prompt = template.invoke({
-        "analysis_data": json.dumps(analysis_data, indent=2),
+        "analysis_data": to_prompt_json(analysis_data),
         "ticker": ticker
     })
 
@@ -16,7 +16,7 @@ from src.tools.api import (
     get_market_cap,
     search_line_items,
 )
-from src.utils.llm import call_llm
+from src.utils.llm import call_llm, to_prompt_json
 from src.utils.progress import progress
 
 __all__ = [
@@ -371,7 +371,7 @@ def _generate_burry_output(
         ]
     )
 
-    prompt = template.invoke({"analysis_data": json.dumps(analysis_data, indent=2), "ticker": ticker})
+    prompt = template.invoke({"analysis_data": to_prompt_json(analysis_data), "ticker": ticker})
 
     # Default fallback signal in case parsing fails
     def create_default_michael_burry_signal():
@@ -13,7 +13,7 @@ from pydantic import BaseModel
 import json
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.llm import call_llm, to_prompt_json
 
 
 class PeterLynchSignal(BaseModel):
@@ -487,7 +487,7 @@ def generate_lynch_output(
         ]
     )
 
-    prompt = template.invoke({"analysis_data": json.dumps(analysis_data, indent=2), "ticker": ticker})
+    prompt = template.invoke({"analysis_data": to_prompt_json(analysis_data), "ticker": ticker})
 
     def create_default_signal():
         return PeterLynchSignal(
@@ -1,4 +1,5 @@
 import json
+import numpy as np
 from langchain_core.messages import HumanMessage
 from langchain_core.prompts import ChatPromptTemplate
 
@@ -6,7 +7,7 @@ from src.graph.state import AgentState, show_agent_reasoning
 from pydantic import BaseModel, Field
 from typing_extensions import Literal
 from src.utils.progress import progress
-from src.utils.llm import call_llm
+from src.utils.llm import call_llm, to_prompt_json
 
 
 class PortfolioDecision(BaseModel):
@@ -20,86 +21,12 @@ class PortfolioManagerOutput(BaseModel):
     decisions: dict[str, PortfolioDecision] = Field(description="Dictionary of ticker to trading decisions")
 
 
-##### Portfolio Management Agent #####
-def portfolio_management_agent(state: AgentState):
-    """Makes final trading decisions and generates orders for multiple tickers"""
-
-    # Get the portfolio and analyst signals
-    portfolio = state["data"]["portfolio"]
-    analyst_signals = state["data"]["analyst_signals"]
-    tickers = state["data"]["tickers"]
-
-    # Get position limits, current prices, and signals for every ticker
-    position_limits = {}
-    current_prices = {}
-    max_shares = {}
-    signals_by_ticker = {}
-    for ticker in tickers:
-        progress.update_status("portfolio_manager", ticker, "Processing analyst signals")
-
-        # Get position limits and current prices for the ticker
-        risk_data = analyst_signals.get("risk_management_agent", {}).get(ticker, {})
-        position_limits[ticker] = risk_data.get("remaining_position_limit", 0)
-        current_prices[ticker] = risk_data.get("current_price", 0)
-
-        # Calculate maximum shares allowed based on position limit and price
-        if current_prices[ticker] > 0:
-            max_shares[ticker] = int(position_limits[ticker] / current_prices[ticker])
-        else:
-            max_shares[ticker] = 0
-
-        # Get signals for the ticker
-        ticker_signals = {}
-        for agent, signals in analyst_signals.items():
-            if agent != "risk_management_agent" and ticker in signals:
-                ticker_signals[agent] = {"signal": signals[ticker]["signal"], "confidence": signals[ticker]["confidence"]}
-        signals_by_ticker[ticker] = ticker_signals
-
-    progress.update_status("portfolio_manager", None, "Generating trading decisions")
-
-    # Generate the trading decision
-    result = generate_trading_decision(
-        tickers=tickers,
-        signals_by_ticker=signals_by_ticker,
-        current_prices=current_prices,
-        max_shares=max_shares,
-        portfolio=portfolio,
-        state=state,
-    )
-
-    # Create the portfolio management message
-    message = HumanMessage(
-        content=json.dumps({ticker: decision.model_dump() for ticker, decision in result.decisions.items()}),
-        name="portfolio_manager",
-    )
-
-    # Print the decision if the flag is set
-    if state["metadata"]["show_reasoning"]:
-        show_agent_reasoning({ticker: decision.model_dump() for ticker, decision in result.decisions.items()}, "Portfolio Manager")
-
-    progress.update_status("portfolio_manager", None, "Done")
-
-    return {
-        "messages": state["messages"] + [message],
-        "data": state["data"],
-    }
-
-
-def generate_trading_decision(
-    tickers: list[str],
-    signals_by_ticker: dict[str, dict],
-    current_prices: dict[str, float],
-    max_shares: dict[str, int],
-    portfolio: dict[str, float],
-    state: AgentState,
-) -> PortfolioManagerOutput:
-    """Attempts to get a decision from the LLM with retry logic"""
-    # Create the prompt template
-    template = ChatPromptTemplate.from_messages(
-        [
-            (
-                "system",
-                """You are a portfolio manager making final trading decisions based on multiple tickers.
+# Prompt templates are immutable, so build this one once at import time
+PORTFOLIO_MANAGER_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            """You are a portfolio manager making final trading decisions based on multiple tickers.
 
               Trading Rules:
               - For long positions:
@@ -134,10 +61,10 @@ def generate_trading_decision(
               - margin_requirement: current margin requirement for short positions (e.g., 0.5 means 50%)
               - total_margin_used: total margin currently in use
               """,
-            ),
-            (
-                "human",
-                """Based on the team's analysis, make your trading decisions for each ticker.
+        ),
+        (
+            "human",
+            """Based on the team's analysis, make your trading decisions for each ticker.
 
               Here are the signals by ticker:
               {signals_by_ticker}
@@ -169,18 +96,104 @@ def generate_trading_decision(
                 }}
               }}
               """,
-            ),
-        ]
+        ),
+    ]
+)
+
+
+##### Portfolio Management Agent #####
+def portfolio_management_agent(state: AgentState):
+    """Makes final trading decisions and generates orders for multiple tickers"""
+
+    # Get the portfolio and analyst signals
+    portfolio = state["data"]["portfolio"]
+    analyst_signals = state["data"]["analyst_signals"]
+    tickers = state["data"]["tickers"]
+
+    # Transpose agent -> ticker -> signal into ticker -> agent -> signal in a single pass
+    signals_by_ticker = {ticker: {} for ticker in tickers}
+    for agent, signals in analyst_signals.items():
+        if agent == "risk_management_agent":
+            continue
+        for ticker, signal in signals.items():
+            ticker_signals = signals_by_ticker.get(ticker)
+            if ticker_signals is not None:
+                ticker_signals[agent] = {"signal": signal["signal"], "confidence": signal["confidence"]}
+
+    # Get position limits and current prices for every ticker
+    risk_signals = analyst_signals.get("risk_management_agent", {})
+    position_limits = {}
+    current_prices = {}
+    for ticker in tickers:
+        progress.update_status("portfolio_manager", ticker, "Processing analyst signals")
+
+        # Get position limits and current prices for the ticker
+        risk_data = risk_signals.get(ticker, {})
+        position_limits[ticker] = risk_data.get("remaining_position_limit", 0)
+        current_prices[ticker] = risk_data.get("current_price", 0)
+
+    # Calculate maximum shares allowed based on position limit and price (zero when there is no price)
+    limits = np.fromiter((position_limits[ticker] for ticker in tickers), dtype=np.float64, count=len(tickers))
+    prices = np.fromiter((current_prices[ticker] for ticker in tickers), dtype=np.float64, count=len(tickers))
+    shares = np.zeros(len(tickers), dtype=np.float64)
+    np.divide(limits, prices, out=shares, where=prices > 0)
+    max_shares = dict(zip(tickers, shares.astype(np.int64).tolist()))
+
+    # Without prices no buy or short can be sized; sells and covers only need a position, so still
+    # ask the LLM whenever there is something to exit
+    positions = portfolio.get("positions", {})
+    has_open_positions = any(positions.get(ticker, {}).get("long", 0) or positions.get(ticker, {}).get("short", 0) for ticker in tickers)
+    if not has_open_positions and not any(price > 0 for price in current_prices.values()):
+        progress.update_status("portfolio_manager", None, "No price data and no open positions, holding")
+        result = PortfolioManagerOutput(decisions={ticker: PortfolioDecision(action="hold", quantity=0, confidence=0.0, reasoning="No price data and no open position, nothing to trade") for ticker in tickers})
+    else:
+        progress.update_status("portfolio_manager", None, "Generating trading decisions")
+
+        # Generate the trading decision
+        result = generate_trading_decision(
+            tickers=tickers,
+            signals_by_ticker=signals_by_ticker,
+            current_prices=current_prices,
+            max_shares=max_shares,
+            portfolio=portfolio,
+            state=state,
+        )
+
+    # Create the portfolio management message
+    message = HumanMessage(
+        content=json.dumps({ticker: decision.model_dump() for ticker, decision in result.decisions.items()}),
+        name="portfolio_manager",
     )
 
+    # Print the decision if the flag is set
+    if state["metadata"]["show_reasoning"]:
+        show_agent_reasoning({ticker: decision.model_dump() for ticker, decision in result.decisions.items()}, "Portfolio Manager")
+
+    progress.update_status("portfolio_manager", None, "Done")
+
+    return {
+        "messages": state["messages"] + [message],
+        "data": state["data"],
+    }
+
+
+def generate_trading_decision(
+    tickers: list[str],
+    signals_by_ticker: dict[str, dict],
+    current_prices: dict[str, float],
+    max_shares: dict[str, int],
+    portfolio: dict[str, float],
+    state: AgentState,
+) -> PortfolioManagerOutput:
+    """Attempts to get a decision from the LLM with retry logic"""
     # Generate the prompt
-    prompt = template.invoke(
+    prompt = PORTFOLIO_MANAGER_PROMPT.invoke(
         {
-            "signals_by_ticker": json.dumps(signals_by_ticker, indent=2),
-            "current_prices": json.dumps(current_prices, indent=2),
-            "max_shares": json.dumps(max_shares, indent=2),
+            "signals_by_ticker": to_prompt_json(signals_by_ticker),
+            "current_prices": to_prompt_json(current_prices),
+            "max_shares": to_prompt_json(max_shares),
             "portfolio_cash": f"{portfolio.get('cash', 0):.2f}",
-            "portfolio_positions": json.dumps(portfolio.get("positions", {}), indent=2),
+            "portfolio_positions": to_prompt_json(portfolio.get("positions", {})),
             "margin_requirement": f"{portfolio.get('margin_requirement', 0):.2f}",
             "total_margin_used": f"{portfolio.get('margin_used', 0):.2f}",
         }
@@ -5,7 +5,7 @@ from pydantic import BaseModel
 import json
 from typing_extensions import Literal
 from src.tools.api import get_financial_metrics, get_market_cap, search_line_items
-from src.utils.llm import call_llm
+from src.utils.llm import call_llm, to_prompt_json
 from src.utils.progress import progress
 
 class RakeshJhunjhunwalaSignal(BaseModel):
@@ -689,7 +689,7 @@ def generate_jhunjhunwala_output(
         ]
     )
 
-    prompt = template.invoke({"analysis_data": json.dumps(analysis_data, indent=2), "ticker": ticker})
+    prompt = template.invoke({"analysis_data": to_prompt_json(analysis_data), "ticker": ticker})
 
     # Default fallback signal in case parsing fails
     def create_default_rakesh_jhunjhunwala_signal():
@@ -1,9 +1,13 @@
 from langchain_core.messages import HumanMessage
 from src.graph.state import AgentState, show_agent_reasoning
 from src.utils.progress import progress
-from src.tools.api import get_prices, prices_to_df
+from src.tools.api import get_price_data
+from concurrent.futures import ThreadPoolExecutor
 import json
 
+# Upper bound on concurrent price requests issued by the risk manager
+MAX_PRICE_FETCH_WORKERS = 8
+
 
 ##### Risk Management Agent #####
 def risk_management_agent(state: AgentState):
@@ -18,28 +22,26 @@ def risk_management_agent(state: AgentState):
 
     # First, fetch prices for all relevant tickers
     all_tickers = set(tickers) | set(portfolio.get("positions", {}).keys())
-    
-    for ticker in all_tickers:
+
+    def fetch_prices(ticker: str):
         progress.update_status("risk_management_agent", ticker, "Fetching price data")
-        
-        prices = get_prices(
+        return ticker, get_price_data(
             ticker=ticker,
             start_date=data["start_date"],
             end_date=data["end_date"],
         )
 
-        if not prices:
-            progress.update_status("risk_management_agent", ticker, "Warning: No price data found")
-            continue
+    # Each fetch is an independent network round-trip, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_PRICE_FETCH_WORKERS, len(all_tickers)))) as executor:
+        fetched_prices = list(executor.map(fetch_prices, all_tickers))
 
-        prices_df = prices_to_df(prices)
-        
+    for ticker, prices_df in fetched_prices:
         if not prices_df.empty:
             current_price = prices_df["close"].iloc[-1]
             current_prices[ticker] = current_price
             progress.update_status("risk_management_agent", ticker, f"Current price: {current_price}")
         else:
-            progress.update_status("risk_management_agent", ticker, "Warning: Empty price data")
+            progress.update_status("risk_management_agent", ticker, "Warning: No price data found")
 
     # Calculate total portfolio value based on current market prices (Net Liquidation Value)
     total_portfolio_value = portfolio.get("cash", 0.0)
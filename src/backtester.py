@@ -1,5 +1,6 @@
 import sys
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 import questionary
@@ -26,6 +27,9 @@ from src.utils.ollama import ensure_ollama_and_model
 
 init(autoreset=True)
 
+# Upper bound on concurrent requests issued while pre-fetching backtest data
+MAX_PREFETCH_WORKERS = 8
+
 
 class Backtester:
     def __init__(
@@ -247,43 +251,48 @@ class Backtester:
           - market value of long positions
           - unrealized gains/losses for short positions
         """
-        total_value = self.portfolio["cash"]
-
-        for ticker in self.tickers:
-            position = self.portfolio["positions"][ticker]
-            price = current_prices[ticker]
-
-            # Long position value
-            long_value = position["long"] * price
-            total_value += long_value
+        long_exposure, short_exposure = self.calculate_exposures(current_prices)
 
-            # Short position unrealized PnL = short_shares * (short_cost_basis - current_price)
-            if position["short"] > 0:
-                total_value -= position["short"] * price
+        # Long positions add their market value; open shorts are owed back at the current price
+        return self.portfolio["cash"] + long_exposure - short_exposure
 
-        return total_value
+    def calculate_exposures(self, current_prices):
+        """Return the (long, short) market value of all positions at the given prices."""
+        positions = self.portfolio["positions"]
+        count = len(self.tickers)
+        prices = np.fromiter((current_prices[ticker] for ticker in self.tickers), dtype=np.float64, count=count)
+        long_shares = np.fromiter((positions[ticker]["long"] for ticker in self.tickers), dtype=np.float64, count=count)
+        short_shares = np.fromiter((positions[ticker]["short"] for ticker in self.tickers), dtype=np.float64, count=count)
+        return float(long_shares @ prices), float(short_shares @ prices)
 
     def prefetch_data(self):
         """Pre-fetch all data needed for the backtest period."""
         print("\nPre-fetching data for the entire backtest period...")
 
         # Convert end_date string to datetime, fetch up to 1 year before
-        end_date_dt = datetime.strptime(self.end_date, "%Y-%m-%d")
+        end_date_dt = datetime.fromisoformat(self.end_date)
         start_date_dt = end_date_dt - relativedelta(years=1)
         start_date_str = start_date_dt.strftime("%Y-%m-%d")
 
-        for ticker in self.tickers:
-            # Fetch price data for the entire period, plus 1 year
-            get_prices(ticker, start_date_str, self.end_date)
+        # Every fetch below is an independent network round-trip, so issue them concurrently
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_PREFETCH_WORKERS, 4 * len(self.tickers)))) as executor:
+            futures = []
+            for ticker in self.tickers:
+                # Fetch price data for the entire period, plus 1 year
+                futures.append(executor.submit(get_prices, ticker, start_date_str, self.end_date))
+
+                # Fetch financial metrics
+                futures.append(executor.submit(get_financial_metrics, ticker, self.end_date, limit=10))
 
-            # Fetch financial metrics
-            get_financial_metrics(ticker, self.end_date, limit=10)
+                # Fetch insider trades
+                futures.append(executor.submit(get_insider_trades, ticker, self.end_date, start_date=self.start_date, limit=1000))
 
-            # Fetch insider trades
-            get_insider_trades(ticker, self.end_date, start_date=self.start_date, limit=1000)
+                # Fetch company news
+                futures.append(executor.submit(get_company_news, ticker, self.end_date, start_date=self.start_date, limit=1000))
 
-            # Fetch company news
-            get_company_news(ticker, self.end_date, start_date=self.start_date, limit=1000)
+            # Surface the first failure, as the sequential loop did
+            for future in futures:
+                future.result()
 
         print("Data pre-fetch complete.")
 
@@ -370,8 +379,7 @@ class Backtester:
             total_value = self.calculate_portfolio_value(current_prices)
 
             # Also compute long/short exposures for final post‐trade state
-            long_exposure = sum(self.portfolio["positions"][t]["long"] * current_prices[t] for t in self.tickers)
-            short_exposure = sum(self.portfolio["positions"][t]["short"] * current_prices[t] for t in self.tickers)
+            long_exposure, short_exposure = self.calculate_exposures(current_prices)
 
             # Calculate gross and net exposures
             gross_exposure = long_exposure + short_exposure
@@ -1,12 +1,152 @@
+import hashlib
+import os
+import re
+import tempfile
+import time
+
+import orjson
+
+from src.data.models import CompanyNews, FinancialMetrics, InsiderTrade, LineItem, Price
+
+# Persisted entries live here so repeated runs over the same window skip the network entirely
+DEFAULT_CACHE_DIR = os.environ.get("FINANCIAL_DATA_CACHE_DIR", os.path.join(".cache", "financial_data"))
+
+# Cached records are rebuilt with model_construct (no validation), so disk entries are filed under a
+# fingerprint of their model's fields; changing a model sends its entries to a fresh directory
+_DISK_CACHE_MODELS = {
+    "prices": Price,
+    "financial_metrics": FinancialMetrics,
+    "line_items": LineItem,
+    "insider_trades": InsiderTrade,
+    "company_news": CompanyNews,
+}
+
+# Names of the files the disk cache writes; pruning never touches anything else
+_SCHEMA_DIR_RE = re.compile(r"[0-9a-f]{12}")
+_ENTRY_FILE_RE = re.compile(r"[0-9a-f]{32}\.json")
+_TMP_FILE_PREFIX = "entry-"
+_TMP_FILE_RE = re.compile(re.escape(_TMP_FILE_PREFIX) + r"[A-Za-z0-9_]+\.tmp")
+
+# Temp files left behind by an interrupted write are swept once they are this old
+STALE_TMP_FILE_SECONDS = 60 * 60
+
+
+def _schema_fingerprint(model) -> str:
+    """Short hash of a model's field names and types."""
+    fields = sorted((name, repr(field.annotation)) for name, field in model.model_fields.items())
+    return hashlib.md5(repr(fields).encode()).hexdigest()[:12]
+
+
 class Cache:
-    """In-memory cache for API responses."""
+    """In-memory cache for API responses, backed by an optional on-disk TTL cache."""
 
-    def __init__(self):
+    def __init__(self, cache_dir: str | None = DEFAULT_CACHE_DIR):
+        self._cache_dir = cache_dir
+        self._schema_versions = {namespace: _schema_fingerprint(model) for namespace, model in _DISK_CACHE_MODELS.items()}
+        self._pruned = False
         self._prices_cache: dict[str, list[dict[str, any]]] = {}
         self._financial_metrics_cache: dict[str, list[dict[str, any]]] = {}
         self._line_items_cache: dict[str, list[dict[str, any]]] = {}
         self._insider_trades_cache: dict[str, list[dict[str, any]]] = {}
         self._company_news_cache: dict[str, list[dict[str, any]]] = {}
+        self._company_facts_cache: dict[str, tuple[float, dict[str, any]]] = {}  # ticker -> (fetched_at, facts)
+
+    def _disk_path(self, namespace: str, key: str) -> str:
+        """Map a cache key to its file, hashing it so arbitrary keys are safe file names."""
+        digest = hashlib.md5(f"{namespace}:{key}".encode()).hexdigest()
+        return os.path.join(self._cache_dir, namespace, self._schema_versions[namespace], f"{digest}.json")
+
+    def _disk_get(self, namespace: str, key: str) -> list[dict[str, any]] | None:
+        """Read an unexpired entry from disk, treating unreadable, malformed or stale files as a miss."""
+        if not self._cache_dir:
+            return None
+        path = self._disk_path(namespace, key)
+        try:
+            with open(path, "rb") as f:
+                entry = orjson.loads(f.read())
+            expired = time.time() - entry["ts"] >= entry["ttl"]
+            data = entry["data"]
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+        if expired:
+            self._remove_file(path)
+            return None
+        return data
+
+    def _disk_set(self, namespace: str, key: str, data: list[dict[str, any]], ttl: float):
+        """Write an entry to disk atomically; failures only cost a future cache miss."""
+        if not self._cache_dir:
+            return
+        if not self._pruned:
+            self._pruned = True
+            self.prune_disk_cache()
+        path = self._disk_path(namespace, key)
+        tmp_path = None
+        try:
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            # A unique temp file per write, so concurrent writers of the same key never share one
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=_TMP_FILE_PREFIX, suffix=".tmp")
+            now = time.time()
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps({"ts": now, "ttl": ttl, "data": data}))
+            # Stamp the file with its expiry so pruning only needs a stat
+            os.utime(tmp_path, (now, now + ttl))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            if tmp_path:
+                self._remove_file(tmp_path)
+
+    def prune_disk_cache(self):
+        """Delete expired entries, and temp files abandoned by interrupted writes, from the disk cache."""
+        if not self._cache_dir:
+            return
+        now = time.time()
+        # The directory is user-configurable, so only touch files this cache could have written
+        for path, file_name in self._disk_cache_files():
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                continue
+            if _ENTRY_FILE_RE.fullmatch(file_name):
+                if mtime <= now:
+                    self._remove_file(path)
+            elif mtime < now - STALE_TMP_FILE_SECONDS:
+                self._remove_file(path)
+
+    def _disk_cache_files(self):
+        """Yield (path, name) for entry and temp files in the namespace directories, including pre-fingerprint entries."""
+        for namespace in _DISK_CACHE_MODELS:
+            namespace_dir = os.path.join(self._cache_dir, namespace)
+            directories = [namespace_dir]
+            try:
+                directories.extend(entry.path for entry in os.scandir(namespace_dir) if entry.is_dir(follow_symlinks=False) and _SCHEMA_DIR_RE.fullmatch(entry.name))
+            except OSError:
+                continue
+            for directory in directories:
+                try:
+                    entries = list(os.scandir(directory))
+                except OSError:
+                    continue
+                for entry in entries:
+                    if (_ENTRY_FILE_RE.fullmatch(entry.name) or _TMP_FILE_RE.fullmatch(entry.name)) and entry.is_file(follow_symlinks=False):
+                        yield entry.path, entry.name
+
+    @staticmethod
+    def _remove_file(path: str):
+        """Delete a file, ignoring one that is already gone or can't be removed."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _get(self, memory: dict[str, list[dict[str, any]]], namespace: str, key: str) -> list[dict[str, any]] | None:
+        """Look a key up in memory, then on disk, promoting disk hits into memory."""
+        if (data := memory.get(key)) is not None:
+            return data
+        if (data := self._disk_get(namespace, key)) is not None:
+            memory[key] = data
+        return data
 
     def _merge_data(self, existing: list[dict] | None, new_data: list[dict], key_field: str) -> list[dict]:
         """Merge existing and new data, avoiding duplicates based on a key field."""
@@ -23,43 +163,64 @@ class Cache:
 
     def get_prices(self, ticker: str) -> list[dict[str, any]] | None:
         """Get cached price data if available."""
-        return self._prices_cache.get(ticker)
+        return self._get(self._prices_cache, "prices", ticker)
 
-    def set_prices(self, ticker: str, data: list[dict[str, any]]):
-        """Append new price data to cache."""
+    def set_prices(self, ticker: str, data: list[dict[str, any]], ttl: float | None = None):
+        """Append new price data to cache (and to disk when a ttl is given)."""
         self._prices_cache[ticker] = self._merge_data(self._prices_cache.get(ticker), data, key_field="time")
+        if ttl:
+            self._disk_set("prices", ticker, self._prices_cache[ticker], ttl)
 
     def get_financial_metrics(self, ticker: str) -> list[dict[str, any]]:
         """Get cached financial metrics if available."""
-        return self._financial_metrics_cache.get(ticker)
+        return self._get(self._financial_metrics_cache, "financial_metrics", ticker)
 
-    def set_financial_metrics(self, ticker: str, data: list[dict[str, any]]):
-        """Append new financial metrics to cache."""
+    def set_financial_metrics(self, ticker: str, data: list[dict[str, any]], ttl: float | None = None):
+        """Append new financial metrics to cache (and to disk when a ttl is given)."""
         self._financial_metrics_cache[ticker] = self._merge_data(self._financial_metrics_cache.get(ticker), data, key_field="report_period")
+        if ttl:
+            self._disk_set("financial_metrics", ticker, self._financial_metrics_cache[ticker], ttl)
 
     def get_line_items(self, ticker: str) -> list[dict[str, any]] | None:
         """Get cached line items if available."""
-        return self._line_items_cache.get(ticker)
+        return self._get(self._line_items_cache, "line_items", ticker)
 
-    def set_line_items(self, ticker: str, data: list[dict[str, any]]):
-        """Append new line items to cache."""
+    def set_line_items(self, ticker: str, data: list[dict[str, any]], ttl: float | None = None):
+        """Append new line items to cache (and to disk when a ttl is given)."""
         self._line_items_cache[ticker] = self._merge_data(self._line_items_cache.get(ticker), data, key_field="report_period")
+        if ttl:
+            self._disk_set("line_items", ticker, self._line_items_cache[ticker], ttl)
 
     def get_insider_trades(self, ticker: str) -> list[dict[str, any]] | None:
         """Get cached insider trades if available."""
-        return self._insider_trades_cache.get(ticker)
+        return self._get(self._insider_trades_cache, "insider_trades", ticker)
 
-    def set_insider_trades(self, ticker: str, data: list[dict[str, any]]):
-        """Append new insider trades to cache."""
+    def set_insider_trades(self, ticker: str, data: list[dict[str, any]], ttl: float | None = None):
+        """Append new insider trades to cache (and to disk when a ttl is given)."""
         self._insider_trades_cache[ticker] = self._merge_data(self._insider_trades_cache.get(ticker), data, key_field="filing_date")  # Could also use transaction_date if preferred
+        if ttl:
+            self._disk_set("insider_trades", ticker, self._insider_trades_cache[ticker], ttl)
 
     def get_company_news(self, ticker: str) -> list[dict[str, any]] | None:
         """Get cached company news if available."""
-        return self._company_news_cache.get(ticker)
+        return self._get(self._company_news_cache, "company_news", ticker)
 
-    def set_company_news(self, ticker: str, data: list[dict[str, any]]):
-        """Append new company news to cache."""
+    def set_company_news(self, ticker: str, data: list[dict[str, any]], ttl: float | None = None):
+        """Append new company news to cache (and to disk when a ttl is given)."""
         self._company_news_cache[ticker] = self._merge_data(self._company_news_cache.get(ticker), data, key_field="date")
+        if ttl:
+            self._disk_set("company_news", ticker, self._company_news_cache[ticker], ttl)
+
+    def get_company_facts(self, ticker: str, max_age: float) -> dict[str, any] | None:
+        """Get cached company facts if they were fetched less than max_age seconds ago."""
+        entry = self._company_facts_cache.get(ticker)
+        if entry and time.monotonic() - entry[0] < max_age:
+            return entry[1]
+        return None
+
+    def set_company_facts(self, ticker: str, data: dict[str, any]):
+        """Replace cached company facts, stamping them with the fetch time."""
+        self._company_facts_cache[ticker] = (time.monotonic(), data)
 
 
 # Global cache instance
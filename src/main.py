@@ -9,7 +9,7 @@ from src.agents.portfolio_manager import portfolio_management_agent
 from src.agents.risk_manager import risk_management_agent
 from src.graph.state import AgentState
 from src.utils.display import print_trading_output
-from src.utils.analysts import ANALYST_ORDER, get_analyst_nodes
+from src.utils.analysts import ANALYST_ORDER, ANALYST_NODES
 from src.utils.progress import progress
 from src.llm.models import LLM_ORDER, OLLAMA_LLM_ORDER, get_model_info, ModelProvider
 from src.utils.ollama import ensure_ollama_and_model
@@ -19,6 +19,7 @@ from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from src.utils.visualize import save_graph_as_png
 import json
+import orjson
 
 # Load environment variables from .env file
 load_dotenv()
@@ -29,7 +30,11 @@ init(autoreset=True)
 def parse_hedge_fund_response(response):
     """Parses a JSON string and returns a dictionary."""
     try:
-        return json.loads(response)
+        try:
+            return orjson.loads(response)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity and non-str input; let the stdlib parser accept the former and raise TypeError for the latter
+            return json.loads(response)
     except json.JSONDecodeError as e:
         print(f"JSON decoding error: {e}\nResponse: {repr(response)}")
         return None
@@ -104,15 +109,12 @@ def create_workflow(selected_analysts=None):
     workflow = StateGraph(AgentState)
     workflow.add_node("start_node", start)
 
-    # Get analyst nodes from the configuration
-    analyst_nodes = get_analyst_nodes()
-
     # Default to all analysts if none selected
     if selected_analysts is None:
-        selected_analysts = list(analyst_nodes.keys())
+        selected_analysts = list(ANALYST_NODES.keys())
     # Add selected analyst nodes
     for analyst_key in selected_analysts:
-        node_name, node_func = analyst_nodes[analyst_key]
+        node_name, node_func = ANALYST_NODES[analyst_key]
         workflow.add_node(node_name, node_func)
         workflow.add_edge("start_node", node_name)
 
@@ -122,7 +124,7 @@ def create_workflow(selected_analysts=None):
 
     # Connect selected analysts to risk management
     for analyst_key in selected_analysts:
-        node_name = analyst_nodes[analyst_key][0]
+        node_name = ANALYST_NODES[analyst_key][0]
         workflow.add_edge(node_name, "risk_management_agent")
 
     workflow.add_edge("risk_management_agent", "portfolio_manager")
@@ -278,7 +280,7 @@ if __name__ == "__main__":
     end_date = args.end_date or datetime.now().strftime("%Y-%m-%d")
     if not args.start_date:
         # Calculate 3 months before end_date
-        end_date_obj = datetime.strptime(end_date, "%Y-%m-%d")
+        end_date_obj = datetime.fromisoformat(end_date)
         start_date = (end_date_obj - relativedelta(months=3)).strftime("%Y-%m-%d")
     else:
         start_date = args.start_date
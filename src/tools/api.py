@@ -1,8 +1,13 @@
 import datetime
+import logging
 import os
 import pandas as pd
 import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.data.cache import get_cache
 from src.data.models import (
@@ -19,9 +24,81 @@ from src.data.models import (
     CompanyFactsResponse,
 )
 
+logger = logging.getLogger(__name__)
+
 # Global cache instance
 _cache = get_cache()
 
+# Upper bound on concurrent line-item requests issued by search_line_items_batch
+MAX_LINE_ITEM_FETCH_WORKERS = 8
+
+# Live company facts (used for today's market cap) change slowly, so reuse them for a short window
+COMPANY_FACTS_TTL_SECONDS = 60
+
+# On-disk cache lifetimes. Daily prices for a closed window never change; filings and news
+# can be backfilled, and anything covering today is still moving.
+HISTORICAL_PRICES_TTL_SECONDS = 90 * 24 * 60 * 60
+HISTORICAL_DATA_TTL_SECONDS = 24 * 60 * 60
+LIVE_DATA_TTL_SECONDS = 5 * 60
+
+
+def _cache_ttl(end_date: str, historical_ttl: int) -> int:
+    """Pick how long to keep a response on disk based on whether its window is already closed."""
+    if end_date < datetime.datetime.now().strftime("%Y-%m-%d"):
+        return historical_ttl
+    return LIVE_DATA_TTL_SECONDS
+
+# Shared HTTP session so repeated calls reuse pooled keep-alive connections instead of re-handshaking
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+# Sized for parallel per-ticker fetches; 429s are left to the slower backoff in _make_api_request
+HTTP_POOL_CONNECTIONS = 20
+HTTP_POOL_MAXSIZE = 50
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[500, 502, 503, 504],
+    allowed_methods=["GET", "POST"],
+    raise_on_status=False,
+    # urllib3 would otherwise retry 429s carrying Retry-After itself, hiding them from _make_api_request's backoff
+    respect_retry_after_header=False,
+)
+
+
+def _build_session() -> requests.Session:
+    """Create an HTTP session with the pooled, retrying adapter mounted."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=HTTP_RETRY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _get_session() -> requests.Session:
+    """Return the shared HTTP session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+# API credentials are read from the environment on first use (after .env has been loaded), then reused
+_api_headers: dict[str, str] | None = None
+
+
+def _get_api_headers() -> dict[str, str]:
+    """Return the request headers carrying the API key, building them once."""
+    global _api_headers
+    if _api_headers is None:
+        headers = {}
+        if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
+            headers["X-API-KEY"] = api_key
+        _api_headers = headers
+    return _api_headers
+
 
 def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: dict = None, max_retries: int = 3) -> requests.Response:
     """
@@ -40,16 +117,17 @@ def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: d
     Raises:
         Exception: If the request fails with a non-429 error
     """
+    session = _get_session()
     for attempt in range(max_retries + 1):  # +1 for initial attempt
         if method.upper() == "POST":
-            response = requests.post(url, headers=headers, json=json_data)
+            response = session.post(url, headers=headers, json=json_data)
         else:
-            response = requests.get(url, headers=headers)
+            response = session.get(url, headers=headers)
         
         if response.status_code == 429 and attempt < max_retries:
             # Linear backoff: 60s, 90s, 120s, 150s...
             delay = 60 + (30 * attempt)
-            print(f"Rate limited (429). Attempt {attempt + 1}/{max_retries + 1}. Waiting {delay}s before retrying...")
+            logger.warning("Rate limited (429). Attempt %d/%d. Waiting %ds before retrying...", attempt + 1, max_retries + 1, delay)
             time.sleep(delay)
             continue
         
@@ -59,17 +137,21 @@ def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: d
 
 def get_prices(ticker: str, start_date: str, end_date: str) -> list[Price]:
     """Fetch price data from cache or API."""
+    # Records were validated when fetched, so skip re-validation
+    return [Price.model_construct(**price) for price in _get_price_records(ticker, start_date, end_date)]
+
+
+def _get_price_records(ticker: str, start_date: str, end_date: str) -> list[dict[str, any]]:
+    """Fetch price data from cache or API as plain dicts, in the shape they are cached."""
     # Create a cache key that includes all parameters to ensure exact matches
     cache_key = f"{ticker}_{start_date}_{end_date}"
-    
+
     # Check cache first - simple exact match
     if cached_data := _cache.get_prices(cache_key):
-        return [Price(**price) for price in cached_data]
+        return cached_data
 
     # If not in cache, fetch from API
-    headers = {}
-    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-        headers["X-API-KEY"] = api_key
+    headers = _get_api_headers()
 
     url = f"https://api.financialdatasets.ai/prices/?ticker={ticker}&interval=day&interval_multiplier=1&start_date={start_date}&end_date={end_date}"
     response = _make_api_request(url, headers)
@@ -84,8 +166,14 @@ def get_prices(ticker: str, start_date: str, end_date: str) -> list[Price]:
         return []
 
     # Cache the results using the comprehensive cache key
-    _cache.set_prices(cache_key, [p.model_dump() for p in prices])
-    return prices
+    records = [p.model_dump() for p in prices]
+    _cache.set_prices(cache_key, records, ttl=_cache_ttl(end_date, HISTORICAL_PRICES_TTL_SECONDS))
+    return records
+
+
+def _financial_metrics_cache_key(ticker: str, end_date: str, period: str, limit: int) -> str:
+    """Cache key for a financial metrics query, shared with get_market_cap's cache lookup."""
+    return f"{ticker}_{period}_{end_date}_{limit}"
 
 
 def get_financial_metrics(
@@ -96,16 +184,14 @@ def get_financial_metrics(
 ) -> list[FinancialMetrics]:
     """Fetch financial metrics from cache or API."""
     # Create a cache key that includes all parameters to ensure exact matches
-    cache_key = f"{ticker}_{period}_{end_date}_{limit}"
+    cache_key = _financial_metrics_cache_key(ticker, end_date, period, limit)
     
     # Check cache first - simple exact match
     if cached_data := _cache.get_financial_metrics(cache_key):
-        return [FinancialMetrics(**metric) for metric in cached_data]
+        return [FinancialMetrics.model_construct(**metric) for metric in cached_data]
 
     # If not in cache, fetch from API
-    headers = {}
-    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-        headers["X-API-KEY"] = api_key
+    headers = _get_api_headers()
 
     url = f"https://api.financialdatasets.ai/financial-metrics/?ticker={ticker}&report_period_lte={end_date}&limit={limit}&period={period}"
     response = _make_api_request(url, headers)
@@ -120,7 +206,7 @@ def get_financial_metrics(
         return []
 
     # Cache the results as dicts using the comprehensive cache key
-    _cache.set_financial_metrics(cache_key, [m.model_dump() for m in financial_metrics])
+    _cache.set_financial_metrics(cache_key, [m.model_dump() for m in financial_metrics], ttl=_cache_ttl(end_date, HISTORICAL_DATA_TTL_SECONDS))
     return financial_metrics
 
 
@@ -133,9 +219,7 @@ def search_line_items(
 ) -> list[LineItem]:
     """Fetch line items from API."""
     # If not in cache or insufficient data, fetch from API
-    headers = {}
-    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-        headers["X-API-KEY"] = api_key
+    headers = _get_api_headers()
 
     url = "https://api.financialdatasets.ai/financials/search/line-items"
 
@@ -159,6 +243,21 @@ def search_line_items(
     return search_results[:limit]
 
 
+def search_line_items_batch(
+    tickers: list[str],
+    line_items: list[str],
+    end_date: str,
+    period: str = "ttm",
+    limit: int = 10,
+) -> dict[str, list[LineItem]]:
+    """Fetch line items for several tickers concurrently, keyed by ticker."""
+    # The endpoint accepts a list of tickers, but its limit isn't documented as per-ticker, so a shared
+    # request could let one ticker's rows crowd out another's; issue one request per ticker and overlap them
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_LINE_ITEM_FETCH_WORKERS, len(tickers)))) as executor:
+        results = executor.map(lambda ticker: search_line_items(ticker, line_items, end_date, period=period, limit=limit), tickers)
+        return dict(zip(tickers, results))
+
+
 def get_insider_trades(
     ticker: str,
     end_date: str,
@@ -171,12 +270,10 @@ def get_insider_trades(
     
     # Check cache first - simple exact match
     if cached_data := _cache.get_insider_trades(cache_key):
-        return [InsiderTrade(**trade) for trade in cached_data]
+        return [InsiderTrade.model_construct(**trade) for trade in cached_data]
 
     # If not in cache, fetch from API
-    headers = {}
-    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-        headers["X-API-KEY"] = api_key
+    headers = _get_api_headers()
 
     all_trades = []
     current_end_date = end_date
@@ -215,7 +312,7 @@ def get_insider_trades(
         return []
 
     # Cache the results using the comprehensive cache key
-    _cache.set_insider_trades(cache_key, [trade.model_dump() for trade in all_trades])
+    _cache.set_insider_trades(cache_key, [trade.model_dump() for trade in all_trades], ttl=_cache_ttl(end_date, HISTORICAL_DATA_TTL_SECONDS))
     return all_trades
 
 
@@ -231,12 +328,10 @@ def get_company_news(
     
     # Check cache first - simple exact match
     if cached_data := _cache.get_company_news(cache_key):
-        return [CompanyNews(**news) for news in cached_data]
+        return [CompanyNews.model_construct(**news) for news in cached_data]
 
     # If not in cache, fetch from API
-    headers = {}
-    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-        headers["X-API-KEY"] = api_key
+    headers = _get_api_headers()
 
     all_news = []
     current_end_date = end_date
@@ -275,7 +370,7 @@ def get_company_news(
         return []
 
     # Cache the results using the comprehensive cache key
-    _cache.set_company_news(cache_key, [news.model_dump() for news in all_news])
+    _cache.set_company_news(cache_key, [news.model_dump() for news in all_news], ttl=_cache_ttl(end_date, HISTORICAL_DATA_TTL_SECONDS))
     return all_news
 
 
@@ -286,26 +381,32 @@ def get_market_cap(
     """Fetch market cap from the API."""
     # Check if end_date is today
     if end_date == datetime.datetime.now().strftime("%Y-%m-%d"):
+        # Check the short-lived cache first, since every agent asks for the same value
+        if cached_facts := _cache.get_company_facts(ticker, max_age=COMPANY_FACTS_TTL_SECONDS):
+            return cached_facts.get("market_cap")
+
         # Get the market cap from company facts API
-        headers = {}
-        if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-            headers["X-API-KEY"] = api_key
+        headers = _get_api_headers()
 
         url = f"https://api.financialdatasets.ai/company/facts/?ticker={ticker}"
         response = _make_api_request(url, headers)
         if response.status_code != 200:
-            print(f"Error fetching company facts: {ticker} - {response.status_code}")
+            logger.error("Error fetching company facts: %s - %s", ticker, response.status_code)
             return None
 
         data = response.json()
         response_model = CompanyFactsResponse(**data)
+        _cache.set_company_facts(ticker, response_model.company_facts.model_dump())
         return response_model.company_facts.market_cap
 
-    financial_metrics = get_financial_metrics(ticker, end_date)
-    if not financial_metrics:
-        return None
-
-    market_cap = financial_metrics[0].market_cap
+    # Only the latest report is needed: reuse the agents' default fetch if it is cached, else ask for one row
+    if cached_metrics := _cache.get_financial_metrics(_financial_metrics_cache_key(ticker, end_date, "ttm", 10)):
+        market_cap = cached_metrics[0].get("market_cap")
+    else:
+        financial_metrics = get_financial_metrics(ticker, end_date, limit=1)
+        if not financial_metrics:
+            return None
+        market_cap = financial_metrics[0].market_cap
 
     if not market_cap:
         return None
@@ -313,19 +414,28 @@ def get_market_cap(
     return market_cap
 
 
+# Column dtypes of a price DataFrame, matching the Price model's field types
+PRICE_COLUMN_DTYPES = {"open": "float64", "close": "float64", "high": "float64", "low": "float64", "volume": "int64"}
+
+
 def prices_to_df(prices: list[Price]) -> pd.DataFrame:
     """Convert prices to a DataFrame."""
-    df = pd.DataFrame([p.model_dump() for p in prices])
+    return _price_records_to_df([p.model_dump() for p in prices])
+
+
+def _price_records_to_df(records: list[dict[str, any]]) -> pd.DataFrame:
+    """Build a date-indexed price DataFrame from price dicts."""
+    if not records:
+        return pd.DataFrame(columns=list(PRICE_COLUMN_DTYPES), index=pd.DatetimeIndex([], name="Date"))
+    df = pd.DataFrame(records)
     df["Date"] = pd.to_datetime(df["time"])
     df.set_index("Date", inplace=True)
-    numeric_cols = ["open", "close", "high", "low", "volume"]
-    for col in numeric_cols:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
+    # Prices are already typed by the Price model, so cast all numeric columns in one pass
+    df = df.astype(PRICE_COLUMN_DTYPES)
     df.sort_index(inplace=True)
     return df
 
 
-# Update the get_price_data function to use the new functions
 def get_price_data(ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
-    prices = get_prices(ticker, start_date, end_date)
-    return prices_to_df(prices)
+    """Fetch price data as a DataFrame, building it straight from the cached records."""
+    return _price_records_to_df(_get_price_records(ticker, start_date, end_date))
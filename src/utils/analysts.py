@@ -129,9 +129,13 @@ ANALYST_CONFIG = {
 ANALYST_ORDER = [(config["display_name"], key) for key, config in sorted(ANALYST_CONFIG.items(), key=lambda x: x[1]["order"])]
 
 
+# Graph node for each analyst, built once since every workflow compilation needs it
+ANALYST_NODES = {key: (f"{key}_agent", config["agent_func"]) for key, config in ANALYST_CONFIG.items()}
+
+
 def get_analyst_nodes():
     """Get the mapping of analyst keys to their (node_name, agent_func) tuples."""
-    return {key: (f"{key}_agent", config["agent_func"]) for key, config in ANALYST_CONFIG.items()}
+    return dict(ANALYST_NODES)
 
 
 def get_agents_list():
@@ -150,7 +154,7 @@ def get_agents_list():
 
 def get_investing_styles():
     """Get all unique investing styles."""
-    return list(set(config["investing_style"] for config in ANALYST_CONFIG.values()))
+    return list(_AGENTS_BY_INVESTING_STYLE)
 
 
 def get_investing_style_display_names():
@@ -165,8 +169,8 @@ def get_investing_style_display_names():
     }
 
 
-def get_agents_by_investing_style():
-    """Get agents grouped by investing style."""
+def _group_agents_by_investing_style():
+    """Group agents by investing style, sorted by order within each group."""
     groups = {}
     for key, config in ANALYST_CONFIG.items():
         style = config["investing_style"]
@@ -184,3 +188,13 @@ def get_agents_by_investing_style():
         groups[style].sort(key=lambda x: x["order"])
     
     return groups
+
+
+# ANALYST_CONFIG is fixed at import, so index agents by investing style once
+_AGENTS_BY_INVESTING_STYLE = _group_agents_by_investing_style()
+
+
+def get_agents_by_investing_style():
+    """Get agents grouped by investing style."""
+    # Return copies so callers can't modify the shared index
+    return {style: [dict(agent) for agent in agents] for style, agents in _AGENTS_BY_INVESTING_STYLE.items()}
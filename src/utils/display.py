@@ -5,13 +5,53 @@ import os
 import json
 
 
+# Display order of agents, derived once from ANALYST_ORDER with Risk Management at the end
+_ANALYST_DISPLAY_ORDER = {display: idx for idx, (display, _) in enumerate(ANALYST_ORDER)}
+_ANALYST_DISPLAY_ORDER["Risk Management"] = len(ANALYST_ORDER)
+
+# Colors for signals and trade actions; anything unlisted is shown in white
+_SIGNAL_COLORS = {
+    "BULLISH": Fore.GREEN,
+    "BEARISH": Fore.RED,
+    "NEUTRAL": Fore.YELLOW,
+}
+_ACTION_COLORS = {
+    "BUY": Fore.GREEN,
+    "SELL": Fore.RED,
+    "HOLD": Fore.YELLOW,
+    "COVER": Fore.GREEN,
+    "SHORT": Fore.RED,
+}
+# The backtest table keeps holds unhighlighted so trades stand out
+_BACKTEST_ACTION_COLORS = {
+    "BUY": Fore.GREEN,
+    "COVER": Fore.GREEN,
+    "SELL": Fore.RED,
+    "SHORT": Fore.RED,
+    "HOLD": Fore.WHITE,
+}
+
+
 def sort_agent_signals(signals):
     """Sort agent signals in a consistent order."""
-    # Create order mapping from ANALYST_ORDER
-    analyst_order = {display: idx for idx, (display, _) in enumerate(ANALYST_ORDER)}
-    analyst_order["Risk Management"] = len(ANALYST_ORDER)  # Add Risk Management at the end
+    return sorted(signals, key=lambda x: _ANALYST_DISPLAY_ORDER.get(x[0], 999))
 
-    return sorted(signals, key=lambda x: analyst_order.get(x[0], 999))
+
+def wrap_text(text: str, max_line_length: int = 60) -> str:
+    """Wrap text on word boundaries so it fits the fixed-width table columns."""
+    lines = []
+    current_line = ""
+    for word in text.split():
+        if len(current_line) + len(word) + 1 > max_line_length:
+            lines.append(current_line)
+            current_line = word
+        elif current_line:
+            current_line += " " + word
+        else:
+            current_line = word
+    if current_line:
+        lines.append(current_line)
+    return "\n".join(lines)
 
 
 def print_trading_output(result: dict) -> None:
@@ -46,11 +86,7 @@ def print_trading_output(result: dict) -> None:
             signal_type = signal.get("signal", "").upper()
             confidence = signal.get("confidence", 0)
 
-            signal_color = {
-                "BULLISH": Fore.GREEN,
-                "BEARISH": Fore.RED,
-                "NEUTRAL": Fore.YELLOW,
-            }.get(signal_type, Fore.WHITE)
+            signal_color = _SIGNAL_COLORS.get(signal_type, Fore.WHITE)
             
             # Get reasoning if available
             reasoning_str = ""
@@ -68,23 +104,7 @@ def print_trading_output(result: dict) -> None:
                     reasoning_str = str(reasoning)
                 
                 # Wrap long reasoning text to make it more readable
-                wrapped_reasoning = ""
-                current_line = ""
-                # Use a fixed width of 60 characters to match the table column width
-                max_line_length = 60
-                for word in reasoning_str.split():
-                    if len(current_line) + len(word) + 1 > max_line_length:
-                        wrapped_reasoning += current_line + "\n"
-                        current_line = word
-                    else:
-                        if current_line:
-                            current_line += " " + word
-                        else:
-                            current_line = word
-                if current_line:
-                    wrapped_reasoning += current_line
-                
-                reasoning_str = wrapped_reasoning
+                reasoning_str = wrap_text(reasoning_str)
 
             table_data.append(
                 [
@@ -110,33 +130,12 @@ def print_trading_output(result: dict) -> None:
 
         # Print Trading Decision Table
         action = decision.get("action", "").upper()
-        action_color = {
-            "BUY": Fore.GREEN,
-            "SELL": Fore.RED,
-            "HOLD": Fore.YELLOW,
-            "COVER": Fore.GREEN,
-            "SHORT": Fore.RED,
-        }.get(action, Fore.WHITE)
+        action_color = _ACTION_COLORS.get(action, Fore.WHITE)
 
         # Get reasoning and format it
         reasoning = decision.get("reasoning", "")
         # Wrap long reasoning text to make it more readable
-        wrapped_reasoning = ""
-        if reasoning:
-            current_line = ""
-            # Use a fixed width of 60 characters to match the table column width
-            max_line_length = 60
-            for word in reasoning.split():
-                if len(current_line) + len(word) + 1 > max_line_length:
-                    wrapped_reasoning += current_line + "\n"
-                    current_line = word
-                else:
-                    if current_line:
-                        current_line += " " + word
-                    else:
-                        current_line = word
-            if current_line:
-                wrapped_reasoning += current_line
+        wrapped_reasoning = wrap_text(reasoning) if reasoning else ""
 
         decision_data = [
             ["Action", f"{action_color}{action}{Style.RESET_ALL}"],
@@ -164,13 +163,7 @@ def print_trading_output(result: dict) -> None:
             
     for ticker, decision in decisions.items():
         action = decision.get("action", "").upper()
-        action_color = {
-            "BUY": Fore.GREEN,
-            "SELL": Fore.RED,
-            "HOLD": Fore.YELLOW,
-            "COVER": Fore.GREEN,
-            "SHORT": Fore.RED,
-        }.get(action, Fore.WHITE)
+        action_color = _ACTION_COLORS.get(action, Fore.WHITE)
         portfolio_data.append(
             [
                 f"{Fore.CYAN}{ticker}{Style.RESET_ALL}",
@@ -206,22 +199,8 @@ def print_trading_output(result: dict) -> None:
             reasoning_str = str(portfolio_manager_reasoning)
             
         # Wrap long reasoning text to make it more readable
-        wrapped_reasoning = ""
-        current_line = ""
-        # Use a fixed width of 60 characters to match the table column width
-        max_line_length = 60
-        for word in reasoning_str.split():
-            if len(current_line) + len(word) + 1 > max_line_length:
-                wrapped_reasoning += current_line + "\n"
-                current_line = word
-            else:
-                if current_line:
-                    current_line += " " + word
-                else:
-                    current_line = word
-        if current_line:
-            wrapped_reasoning += current_line
-            
+        wrapped_reasoning = wrap_text(reasoning_str)
+
         print(f"\n{Fore.WHITE}{Style.BRIGHT}Portfolio Strategy:{Style.RESET_ALL}")
         print(f"{Fore.CYAN}{wrapped_reasoning}{Style.RESET_ALL}")
 
@@ -326,13 +305,7 @@ def format_backtest_row(
 ) -> list[any]:
     """Format a row for the backtest results table"""
     # Color the action
-    action_color = {
-        "BUY": Fore.GREEN,
-        "COVER": Fore.GREEN,
-        "SELL": Fore.RED,
-        "SHORT": Fore.RED,
-        "HOLD": Fore.WHITE,
-    }.get(action.upper(), Fore.WHITE)
+    action_color = _BACKTEST_ACTION_COLORS.get(action.upper(), Fore.WHITE)
 
     if is_summary:
         return_color = Fore.GREEN if return_pct >= 0 else Fore.RED
@@ -1,11 +1,20 @@
 """Helper functions for LLM"""
 
+import functools
 import json
+import logging
+import re
+import orjson
 from pydantic import BaseModel
 from src.llm.models import get_model, get_model_info
 from src.utils.progress import progress
 from src.graph.state import AgentState
 
+logger = logging.getLogger(__name__)
+
+# Matches the body of a ```json fenced block in a model response
+_JSON_BLOCK_RE = re.compile(r"```json(.*?)```", re.DOTALL)
+
 
 def call_llm(
     prompt: any,
@@ -41,14 +50,7 @@ def call_llm(
         model_provider = "OPENAI"
 
     model_info = get_model_info(model_name, model_provider)
-    llm = get_model(model_name, model_provider)
-
-    # For non-JSON support models, we can use structured output
-    if not (model_info and not model_info.has_json_mode()):
-        llm = llm.with_structured_output(
-            pydantic_model,
-            method="json_mode",
-        )
+    llm = get_llm_runnable(model_name, model_provider, pydantic_model)
 
     # Call the LLM with retries
     for attempt in range(max_retries):
@@ -69,7 +71,7 @@ def call_llm(
                 progress.update_status(agent_name, None, f"Error - retry {attempt + 1}/{max_retries}")
 
             if attempt == max_retries - 1:
-                print(f"Error in LLM call after {max_retries} attempts: {e}")
+                logger.error("Error in LLM call after %d attempts: %s", max_retries, e)
                 # Use default_factory if provided, otherwise create a basic default
                 if default_factory:
                     return default_factory()
@@ -79,8 +81,31 @@ def call_llm(
     return create_default_response(pydantic_model)
 
 
+@functools.lru_cache(maxsize=None)
+def get_llm_runnable(model_name: str, model_provider: str, pydantic_model: type[BaseModel]):
+    """Get the runnable for a model and output schema, built once since neither changes after startup."""
+    model_info = get_model_info(model_name, model_provider)
+    llm = get_model(model_name, model_provider)
+
+    # For non-JSON support models, we can use structured output
+    if not (model_info and not model_info.has_json_mode()):
+        llm = llm.with_structured_output(
+            pydantic_model,
+            method="json_mode",
+        )
+    return llm
+
+
 def create_default_response(model_class: type[BaseModel]) -> BaseModel:
     """Creates a safe default response based on the model's fields."""
+    # Hand each response its own dict defaults so callers can't mutate the cached template
+    default_values = {name: dict(value) if isinstance(value, dict) else value for name, value in _default_values(model_class).items()}
+    return model_class(**default_values)
+
+
+@functools.lru_cache(maxsize=None)
+def _default_values(model_class: type[BaseModel]) -> dict[str, any]:
+    """Works out the default for each field of a model once, since field annotations never change."""
     default_values = {}
     for field_name, field in model_class.model_fields.items():
         if field.annotation == str:
@@ -98,24 +123,30 @@ def create_default_response(model_class: type[BaseModel]) -> BaseModel:
             else:
                 default_values[field_name] = None
 
-    return model_class(**default_values)
+    return default_values
 
 
 def extract_json_from_response(content: str) -> dict | None:
     """Extracts JSON from markdown-formatted response."""
     try:
-        json_start = content.find("```json")
-        if json_start != -1:
-            json_text = content[json_start + 7 :]  # Skip past ```json
-            json_end = json_text.find("```")
-            if json_end != -1:
-                json_text = json_text[:json_end].strip()
+        json_match = _JSON_BLOCK_RE.search(content)
+        if json_match:
+            json_text = json_match.group(1).strip()
+            try:
+                return orjson.loads(json_text)
+            except orjson.JSONDecodeError:
+                # Fall back to the stdlib parser, which also accepts NaN/Infinity literals
                 return json.loads(json_text)
     except Exception as e:
-        print(f"Error extracting JSON from response: {e}")
+        logger.error("Error extracting JSON from response: %s", e)
     return None
 
 
+def to_prompt_json(data: any) -> str:
+    """Serializes prompt inputs to compact JSON; the LLM doesn't need indentation, so neither do we."""
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
 def get_agent_model_config(state, agent_name):
     """
     Get model configuration for a specific agent from the state.
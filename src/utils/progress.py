@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+import threading
 from rich.console import Console
 from rich.live import Live
 from rich.table import Table
@@ -18,20 +19,26 @@ class AgentProgress:
         self.live = Live(self.table, console=console, refresh_per_second=4)
         self.started = False
         self.update_handlers: List[Callable[[str, Optional[str], str], None]] = []
+        # Guards agent_status and update_handlers, which are touched from request handlers and agent threads
+        self._lock = threading.Lock()
 
     def register_handler(self, handler: Callable[[str, Optional[str], str], None]):
         """Register a handler to be called when agent status updates."""
-        self.update_handlers.append(handler)
+        with self._lock:
+            self.update_handlers.append(handler)
         return handler  # Return handler to support use as decorator
 
     def unregister_handler(self, handler: Callable[[str, Optional[str], str], None]):
         """Unregister a previously registered handler."""
-        if handler in self.update_handlers:
-            self.update_handlers.remove(handler)
+        with self._lock:
+            if handler in self.update_handlers:
+                self.update_handlers.remove(handler)
 
     def start(self):
         """Start the progress display."""
         if not self.started:
+            with self._lock:
+                self._refresh_display()
             self.live.start()
             self.started = True
 
@@ -43,29 +50,36 @@ class AgentProgress:
 
     def update_status(self, agent_name: str, ticker: Optional[str] = None, status: str = "", analysis: Optional[str] = None):
         """Update the status of an agent."""
-        if agent_name not in self.agent_status:
-            self.agent_status[agent_name] = {"status": "", "ticker": None}
-
-        if ticker:
-            self.agent_status[agent_name]["ticker"] = ticker
-        if status:
-            self.agent_status[agent_name]["status"] = status
-        if analysis:
-            self.agent_status[agent_name]["analysis"] = analysis
-        
-        # Set the timestamp as UTC datetime
-        timestamp = datetime.now(timezone.utc).isoformat()
-        self.agent_status[agent_name]["timestamp"] = timestamp
+        with self._lock:
+            if agent_name not in self.agent_status:
+                self.agent_status[agent_name] = {"status": "", "ticker": None}
+
+            if ticker:
+                self.agent_status[agent_name]["ticker"] = ticker
+            if status:
+                self.agent_status[agent_name]["status"] = status
+            if analysis:
+                self.agent_status[agent_name]["analysis"] = analysis
+
+            # Set the timestamp as UTC datetime
+            timestamp = datetime.now(timezone.utc).isoformat()
+            self.agent_status[agent_name]["timestamp"] = timestamp
+
+            # Snapshot handlers so concurrent (un)registration can't disturb iteration
+            handlers = list(self.update_handlers)
+
+            # Only rebuild the styled table when it is being rendered (the API server never starts it)
+            if self.started:
+                self._refresh_display()
 
         # Notify all registered handlers
-        for handler in self.update_handlers:
+        for handler in handlers:
             handler(agent_name, ticker, status, analysis, timestamp)
 
-        self._refresh_display()
-
     def get_all_status(self):
         """Get the current status of all agents as a dictionary."""
-        return {agent_name: {"ticker": info["ticker"], "status": info["status"], "display_name": self._get_display_name(agent_name)} for agent_name, info in self.agent_status.items()}
+        with self._lock:
+            return {agent_name: {"ticker": info["ticker"], "status": info["status"], "display_name": self._get_display_name(agent_name)} for agent_name, info in self.agent_status.items()}
 
     def _get_display_name(self, agent_name: str) -> str:
         """Convert agent_name to a display-friendly format."""
@@ -1,14 +1,17 @@
 import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 from unittest.mock import Mock, patch, call
 
-from src.tools.api import _make_api_request, get_prices
+from src.tools.api import _build_session, _make_api_request, get_prices
 
 class TestRateLimiting:
     """Test suite for API rate limiting functionality."""
 
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.api.requests.Session.get')
     def test_handles_single_rate_limit(self, mock_get, mock_sleep):
         """Test that API retries once after a 429 and succeeds."""
         # Setup mock responses: first 429, then 200
@@ -42,7 +45,7 @@ class TestRateLimiting:
         mock_sleep.assert_called_once_with(60)
 
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.api.requests.Session.get')
     def test_handles_multiple_rate_limits(self, mock_get, mock_sleep):
         """Test that API retries multiple times after 429s."""
         # Setup mock responses: three 429s, then 200
@@ -79,7 +82,7 @@ class TestRateLimiting:
         mock_sleep.assert_has_calls(expected_calls)
 
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.post')
+    @patch('src.tools.api.requests.Session.post')
     def test_handles_post_rate_limiting(self, mock_post, mock_sleep):
         """Test that POST requests handle rate limiting."""
         # Setup mock responses: first 429, then 200
@@ -114,7 +117,7 @@ class TestRateLimiting:
         mock_sleep.assert_called_once_with(60)
 
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.api.requests.Session.get')
     def test_ignores_other_errors(self, mock_get, mock_sleep):
         """Test that non-429 errors are returned without retrying."""
         # Setup mock response: 500 error
@@ -141,7 +144,7 @@ class TestRateLimiting:
         mock_sleep.assert_not_called()
 
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.api.requests.Session.get')
     def test_normal_success_requests(self, mock_get, mock_sleep):
         """Test that successful requests return immediately without retry."""
         # Setup mock response: 200 success
@@ -169,7 +172,7 @@ class TestRateLimiting:
 
     @patch('src.tools.api._cache')
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.api.requests.Session.get')
     def test_full_integration(self, mock_get, mock_sleep, mock_cache):
         """Test that get_prices function properly handles rate limiting."""
         # Mock cache to return None (cache miss)
@@ -216,7 +219,7 @@ class TestRateLimiting:
         mock_cache.set_prices.assert_called_once()
 
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.api.requests.Session.get')
     def test_max_retries_exceeded(self, mock_get, mock_sleep):
         """Test that function stops retrying after max_retries and returns final 429."""
         # Setup mock responses: all 429s (exceeds max retries)
@@ -245,5 +248,52 @@ class TestRateLimiting:
         mock_sleep.assert_has_calls(expected_calls)
 
 
+
+class TestSessionRetryPolicy:
+    """Test the shared session's transport-level retries against a real HTTP server."""
+
+    @pytest.fixture
+    def server(self):
+        """Serve a 429 with Retry-After on the first request and 200 afterwards."""
+        hits = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append(self.path)
+                if len(hits) == 1:
+                    self.send_response(429)
+                    self.send_header("Retry-After", "1")
+                else:
+                    self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield f"http://127.0.0.1:{httpd.server_address[1]}/test", hits
+        finally:
+            httpd.shutdown()
+            httpd.server_close()
+
+    @patch('src.tools.api.time.sleep')
+    def test_retry_after_429_reaches_backoff(self, mock_sleep, server):
+        """Test that a 429 with Retry-After is not retried by urllib3 but by _make_api_request."""
+        url, hits = server
+
+        with patch('src.tools.api._session', _build_session()), patch.dict(os.environ, {"NO_PROXY": "127.0.0.1", "no_proxy": "127.0.0.1"}):
+            result = _make_api_request(url, {})
+
+        assert result.status_code == 200
+        assert len(hits) == 2
+
+        # The only sleep is our own linear backoff, not urllib3 honoring Retry-After
+        mock_sleep.assert_called_once_with(60)
+
+
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
@@ -0,0 +1,192 @@
+import os
+import threading
+import time
+
+import pytest
+from unittest.mock import patch
+
+from src.data.cache import Cache, STALE_TMP_FILE_SECONDS
+
+
+PRICES = [{"time": "2024-01-02T00:00:00Z", "open": 100.0, "close": 101.0, "high": 102.0, "low": 99.0, "volume": 1000}]
+
+
+def _cache_files(root, suffix):
+    """List every file under root with the given suffix."""
+    return [os.path.join(directory, name) for directory, _, names in os.walk(root) for name in names if name.endswith(suffix)]
+
+
+class TestDiskCache:
+    """Test suite for the on-disk TTL layer of the API cache."""
+
+    def test_entry_is_read_back_by_a_new_cache(self, tmp_path):
+        """Test that an entry written with a ttl survives into a fresh Cache instance."""
+        Cache(str(tmp_path)).set_prices("AAPL_2024-01-01_2024-01-02", PRICES, ttl=60)
+
+        assert Cache(str(tmp_path)).get_prices("AAPL_2024-01-01_2024-01-02") == PRICES
+
+    def test_disk_hit_is_promoted_to_memory(self, tmp_path):
+        """Test that a disk hit is kept in memory, so later reads don't touch the file."""
+        Cache(str(tmp_path)).set_prices("AAPL", PRICES, ttl=60)
+        cache = Cache(str(tmp_path))
+
+        assert cache.get_prices("AAPL") == PRICES
+
+        for path in _cache_files(tmp_path, ".json"):
+            os.remove(path)
+        assert cache.get_prices("AAPL") == PRICES
+
+    def test_entry_without_ttl_stays_in_memory(self, tmp_path):
+        """Test that set_* without a ttl doesn't write to disk."""
+        Cache(str(tmp_path)).set_prices("AAPL", PRICES)
+
+        assert _cache_files(tmp_path, ".json") == []
+        assert Cache(str(tmp_path)).get_prices("AAPL") is None
+
+    def test_expired_entry_is_a_miss_and_removed(self, tmp_path):
+        """Test that an entry past its ttl is ignored and deleted."""
+        now = time.time()
+        with patch("src.data.cache.time.time", return_value=now):
+            Cache(str(tmp_path)).set_prices("AAPL", PRICES, ttl=60)
+
+        with patch("src.data.cache.time.time", return_value=now + 59):
+            assert Cache(str(tmp_path)).get_prices("AAPL") == PRICES
+        with patch("src.data.cache.time.time", return_value=now + 60):
+            assert Cache(str(tmp_path)).get_prices("AAPL") is None
+
+        assert _cache_files(tmp_path, ".json") == []
+
+    @pytest.mark.parametrize("content", [b"{not json", b"[]", b'{"ts": 1}', b""])
+    def test_malformed_file_is_a_miss(self, tmp_path, content):
+        """Test that corrupt or wrongly shaped files are treated as a cache miss."""
+        cache = Cache(str(tmp_path))
+        cache.set_prices("AAPL", PRICES, ttl=60)
+        (path,) = _cache_files(tmp_path, ".json")
+        with open(path, "wb") as f:
+            f.write(content)
+
+        assert Cache(str(tmp_path)).get_prices("AAPL") is None
+
+    def test_unreadable_file_is_a_miss(self, tmp_path):
+        """Test that a path that can't be read as a file is treated as a cache miss."""
+        cache = Cache(str(tmp_path))
+        cache.set_prices("AAPL", PRICES, ttl=60)
+        (path,) = _cache_files(tmp_path, ".json")
+        os.remove(path)
+        os.mkdir(path)
+
+        assert Cache(str(tmp_path)).get_prices("AAPL") is None
+
+    def test_schema_change_is_a_miss(self, tmp_path):
+        """Test that entries written for a different model shape are not returned."""
+        Cache(str(tmp_path)).set_prices("AAPL", PRICES, ttl=60)
+        cache = Cache(str(tmp_path))
+        cache._schema_versions["prices"] = "changed"
+
+        assert cache.get_prices("AAPL") is None
+
+    def test_concurrent_writes_of_the_same_key(self, tmp_path):
+        """Test that threads writing the same key leave one readable entry and no temp files."""
+        cache = Cache(str(tmp_path))
+        cache.prune_disk_cache()
+        errors = []
+
+        def write(index):
+            try:
+                for _ in range(20):
+                    cache._disk_set("prices", "AAPL", [dict(PRICES[0], volume=index)], ttl=60)
+            except Exception as e:  # pragma: no cover - surfaced by the assertion below
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert _cache_files(tmp_path, ".tmp") == []
+        assert len(_cache_files(tmp_path, ".json")) == 1
+        assert Cache(str(tmp_path)).get_prices("AAPL")[0]["volume"] in range(8)
+
+    def test_prune_removes_expired_entries_and_stale_temp_files(self, tmp_path):
+        """Test that pruning deletes expired entries and abandoned temp files but keeps live entries."""
+        now = time.time()
+        cache = Cache(str(tmp_path))
+        cache._pruned = True
+        with patch("src.data.cache.time.time", return_value=now - 120):
+            cache.set_prices("EXPIRED", PRICES, ttl=60)
+        cache.set_prices("LIVE", PRICES, ttl=60)
+
+        entry_dir = tmp_path / "prices" / cache._schema_versions["prices"]
+        stale_tmp = entry_dir / "entry-abandoned.tmp"
+        stale_tmp.write_bytes(b"partial")
+        os.utime(stale_tmp, (now - STALE_TMP_FILE_SECONDS - 1, now - STALE_TMP_FILE_SECONDS - 1))
+        fresh_tmp = entry_dir / "entry-inprogress.tmp"
+        fresh_tmp.write_bytes(b"partial")
+
+        cache.prune_disk_cache()
+
+        assert len(_cache_files(tmp_path, ".json")) == 1
+        assert not stale_tmp.exists()
+        assert fresh_tmp.exists()
+        assert Cache(str(tmp_path)).get_prices("LIVE") == PRICES
+
+    def test_prune_leaves_foreign_files_alone(self, tmp_path):
+        """Test that pruning only deletes files the cache wrote, even when pointed at a shared directory."""
+        old = time.time() - STALE_TMP_FILE_SECONDS - 1
+        cache = Cache(str(tmp_path))
+        cache.set_prices("LIVE", PRICES, ttl=60)
+        entry_dir = tmp_path / "prices" / cache._schema_versions["prices"]
+
+        foreign = [
+            tmp_path / "package.json",
+            tmp_path / "sub" / "api_models.json",
+            tmp_path / "abandoned.tmp",
+            tmp_path / "prices" / "notes.json",
+            tmp_path / "prices" / "abandoned.tmp",
+            entry_dir / "settings.json",
+            entry_dir / "abandoned.tmp",
+            tmp_path / "other" / ("0" * 32 + ".json"),
+        ]
+        for path in foreign:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"{}")
+            os.utime(path, (old, old))
+
+        cache.prune_disk_cache()
+
+        assert all(path.exists() for path in foreign)
+        assert cache.get_prices("LIVE") == PRICES
+
+    def test_prune_removes_entries_from_before_schema_fingerprints(self, tmp_path):
+        """Test that expired entries written directly under a namespace directory are still swept."""
+        legacy = tmp_path / "prices" / ("a" * 32 + ".json")
+        legacy.parent.mkdir(parents=True)
+        legacy.write_bytes(b"{}")
+
+        Cache(str(tmp_path)).prune_disk_cache()
+
+        assert not legacy.exists()
+
+    def test_first_write_prunes_expired_entries(self, tmp_path):
+        """Test that the first disk write of a process sweeps out expired entries."""
+        now = time.time()
+        with patch("src.data.cache.time.time", return_value=now - 120):
+            Cache(str(tmp_path)).set_prices("EXPIRED", PRICES, ttl=60)
+
+        Cache(str(tmp_path)).set_prices("LIVE", PRICES, ttl=60)
+
+        assert len(_cache_files(tmp_path, ".json")) == 1
+
+    def test_disabled_disk_cache_writes_nothing(self, tmp_path):
+        """Test that a Cache without a directory stays purely in memory."""
+        cache = Cache(None)
+        cache.set_prices("AAPL", PRICES, ttl=60)
+
+        assert cache.get_prices("AAPL") == PRICES
+        assert os.listdir(tmp_path) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,90 @@
+import pytest
+from unittest.mock import Mock, patch
+
+from src.tools.api import search_line_items, search_line_items_batch
+
+
+def _line_item_rows(ticker, count):
+    """Build count annual line-item rows for a ticker, newest first."""
+    return [{"ticker": ticker, "report_period": f"{2024 - i}-12-31", "period": "annual", "currency": "USD", "revenue": 1000.0 - i} for i in range(count)]
+
+
+def _respond_with(rows_by_ticker):
+    """Mock Session.post side effect answering each request with the rows for its ticker."""
+
+    def post(url, headers=None, json=None):
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {"search_results": [row for ticker in json["tickers"] for row in rows_by_ticker.get(ticker, [])]}
+        return response
+
+    return post
+
+
+class TestSearchLineItems:
+    """Test suite for single and multi-ticker line item searches."""
+
+    @patch('src.tools.api.requests.Session.post')
+    def test_batch_returns_results_keyed_by_requested_ticker(self, mock_post):
+        """Test that each ticker gets its own request and its own results."""
+        mock_post.side_effect = _respond_with({"AAPL": _line_item_rows("AAPL", 3), "MSFT": _line_item_rows("MSFT", 2)})
+
+        results = search_line_items_batch(["AAPL", "MSFT"], ["revenue"], "2024-12-31", period="annual", limit=10)
+
+        assert list(results) == ["AAPL", "MSFT"]
+        assert [item.ticker for item in results["AAPL"]] == ["AAPL"] * 3
+        assert [item.ticker for item in results["MSFT"]] == ["MSFT"] * 2
+
+        # One request per ticker, each with the caller's limit
+        assert mock_post.call_count == 2
+        bodies = sorted((call.kwargs["json"] for call in mock_post.call_args_list), key=lambda body: body["tickers"])
+        assert [body["tickers"] for body in bodies] == [["AAPL"], ["MSFT"]]
+        assert all(body["limit"] == 10 for body in bodies)
+
+    @patch('src.tools.api.requests.Session.post')
+    def test_results_are_truncated_to_limit(self, mock_post):
+        """Test that a ticker never gets more than limit rows, keeping the API's order."""
+        mock_post.side_effect = _respond_with({"AAPL": _line_item_rows("AAPL", 15)})
+
+        results = search_line_items_batch(["AAPL"], ["revenue"], "2024-12-31", period="annual", limit=10)
+
+        assert [item.report_period for item in results["AAPL"]] == [f"{2024 - i}-12-31" for i in range(10)]
+
+    @patch('src.tools.api.requests.Session.post')
+    def test_ticker_with_many_reports_does_not_starve_others(self, mock_post):
+        """Test that a ticker returning more than limit rows doesn't crowd out later tickers."""
+        mock_post.side_effect = _respond_with({"AAPL": _line_item_rows("AAPL", 25), "MSFT": _line_item_rows("MSFT", 10), "NVDA": _line_item_rows("NVDA", 4)})
+
+        results = search_line_items_batch(["AAPL", "MSFT", "NVDA"], ["revenue"], "2024-12-31", period="annual", limit=10)
+
+        assert {ticker: len(items) for ticker, items in results.items()} == {"AAPL": 10, "MSFT": 10, "NVDA": 4}
+
+    @patch('src.tools.api.requests.Session.post')
+    def test_results_are_not_dropped_when_the_api_normalizes_the_symbol(self, mock_post):
+        """Test that rows come back even if the API spells the ticker differently than requested."""
+        mock_post.side_effect = _respond_with({"brk.b": _line_item_rows("BRK-B", 2)})
+
+        assert len(search_line_items("brk.b", ["revenue"], "2024-12-31", period="annual")) == 2
+        assert len(search_line_items_batch(["brk.b"], ["revenue"], "2024-12-31", period="annual")["brk.b"]) == 2
+
+    @patch('src.tools.api.requests.Session.post')
+    def test_batch_raises_when_a_request_fails(self, mock_post):
+        """Test that a failing ticker surfaces the error like the single-ticker call."""
+        ok = _respond_with({"AAPL": _line_item_rows("AAPL", 1)})
+
+        def post(url, headers=None, json=None):
+            if json["tickers"] == ["MSFT"]:
+                response = Mock()
+                response.status_code = 500
+                response.text = "Server Error"
+                return response
+            return ok(url, headers=headers, json=json)
+
+        mock_post.side_effect = post
+
+        with pytest.raises(Exception, match="MSFT - 500"):
+            search_line_items_batch(["AAPL", "MSFT"], ["revenue"], "2024-12-31", period="annual")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])